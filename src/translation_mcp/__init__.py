@@ -3,10 +3,14 @@
 __version__ = "1.0.0"
 
 from .config import TranslationConfig
-from .crowdin_client import CrowdinClient, UntranslatedString
+from .crowdin_client import CrowdinApiError, CrowdinClient, UntranslatedString
+from .string_classifier import StringClassifier, StringType
 
 __all__ = [
     "TranslationConfig",
+    "CrowdinApiError",
     "CrowdinClient",
     "UntranslatedString",
+    "StringClassifier",
+    "StringType",
 ]
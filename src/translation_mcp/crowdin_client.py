@@ -1,13 +1,89 @@
 """Crowdin API client using official crowdin-api-client."""
 
-from typing import List, Dict, Any, Optional
+import asyncio
+import json
+import random
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterator, Iterable, List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from crowdin_api import CrowdinClient as OfficialCrowdinClient
 
 
-@dataclass
+class CrowdinApiError(Exception):
+    """Raised when a Crowdin API operation fails.
+
+    Wraps the underlying SDK error with context about what the client was
+    doing, so callers can catch API failures without a bare except Exception.
+    """
+
+
+class _TokenBucket:
+    """Minimal asyncio token bucket used to pace outgoing API requests.
+
+    Crowdin throttles around 20 parallel requests per account, so the
+    client paces itself instead of relying purely on 429 retries. Kept
+    in-tree rather than pulling in aiolimiter for a dozen lines.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until the bucket refills if empty."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """Best-effort detection of Crowdin 429 throttling behind the generic error wrappers."""
+    message = str(error)
+    return '429' in message or 'Too Many Requests' in message or 'Throttled' in message
+
+
+def _escape_croql(value: str) -> str:
+    """Escape a string literal for safe embedding in a CroQL query."""
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+
+@lru_cache(maxsize=64)
+def _croql_label_exclusion(exclude_labels: tuple) -> str:
+    """
+    Build the CroQL suffix excluding strings carrying any given label.
+
+    Cached per distinct label tuple, so repeated calls with the same
+    exclusions (the overwhelmingly common case) reuse the same string.
+    """
+    return ''.join(
+        f' and count of labels where (title = "{_escape_croql(label)}") = 0'
+        for label in exclude_labels
+    )
+
+
+@dataclass(slots=True)
 class UntranslatedString:
-    """Represents an untranslated string from Crowdin."""
+    """Represents an untranslated string from Crowdin.
+
+    Per-language status is stored as a bitmask over target_languages
+    (bit i set = languages[i] has a translation) instead of per-string
+    dicts of dicts; missing_languages and translation_progress are
+    reconstructed lazily for compatibility.
+    """
     id: int
     text: str
     identifier: str
@@ -15,13 +91,54 @@ class UntranslatedString:
     file_id: Optional[int] = None
     labels: List[str] = field(default_factory=list)
     existing_translations: Dict[str, str] = field(default_factory=dict)
-    missing_languages: List[str] = field(default_factory=list)
-    translation_progress: Dict[str, Any] = field(default_factory=dict)
+    target_languages: tuple = ()
+    translated_mask: int = 0
+
+    @property
+    def missing_languages(self) -> List[str]:
+        """Language codes that still need a translation."""
+        mask = self.translated_mask
+        return [
+            lang for i, lang in enumerate(self.target_languages)
+            if not mask & (1 << i)
+        ]
+
+    @property
+    def translation_progress(self) -> Dict[str, Any]:
+        """Detailed per-language status dictionary (reconstructed from the mask)."""
+        mask = self.translated_mask
+        progress = {}
+        for i, lang in enumerate(self.target_languages):
+            if mask & (1 << i):
+                progress[lang] = {'status': 'translated', 'has_translation': True}
+            else:
+                progress[lang] = {'status': 'missing', 'has_translation': False}
+        return progress
 
 
 class CrowdinClient:
     """Client for interacting with Crowdin API using official client."""
-    
+
+    # How long a fetched label list stays valid before re-fetching
+    LABELS_CACHE_TTL = 60.0
+
+    # CroQL query templates (only the dynamic predicates get appended per call)
+    CROQL_UNTRANSLATED = 'count of translations < {total_languages}'
+    CROQL_TEXT_EQUALS = 'text = "{text}"'
+
+    # Where the cross-run language-list cache lives, and how long an
+    # entry stays valid (target languages change very rarely)
+    DISK_CACHE_DIR = Path.home() / ".cache" / "translation_mcp"
+    LANGUAGES_DISK_TTL = 24 * 3600.0
+
+    # Max per-string translation dictionaries kept in memory per run
+    STRING_TRANSLATIONS_CACHE_SIZE = 4096
+
+    # How long the in-memory language list stays valid in a long-running
+    # process before being re-fetched from the API
+    LANGUAGES_TTL = 3600.0
+
+
     def __init__(self, api_token: str, project_id: str, base_url: str):
         """
         Initialize Crowdin client.
@@ -33,30 +150,158 @@ class CrowdinClient:
         """
         self.project_id = int(project_id)
         self.client = OfficialCrowdinClient(token=api_token)
-        self._project_languages_cache: Optional[List[str]] = None
-    
-    def get_project_languages(self) -> List[str]:
+        # Resource properties on the official client build a new wrapper
+        # object on every attribute access; grab each one once so all
+        # requests go through the same wrappers (and the single shared
+        # requests.Session connection pool underneath).
+        self._projects = self.client.projects
+        self._source_strings = self.client.source_strings
+        self._string_translations = self.client.string_translations
+        self._labels = self.client.labels
+        self._project_languages_future: Optional["asyncio.Future[List[str]]"] = None
+        self._project_languages_ts: float = 0.0
+        self._languages_fetched_once = False
+        self._labels_cache: Optional[List[Dict[str, Any]]] = None
+        self._labels_cache_ts: float = 0.0
+        self._string_translations_cache: Dict[int, Dict[str, str]] = {}
+        # Bound concurrent Crowdin requests and pace them over time so
+        # parallel tool calls stay under the API rate limit
+        self._request_semaphore = asyncio.Semaphore(10)
+        self._rate_limiter = _TokenBucket(rate=15.0, capacity=15.0)
+
+    async def _api_call(
+        self,
+        func,
+        *args,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        **kwargs
+    ):
+        """
+        Run one synchronous SDK call in a worker thread, with throttling retry.
+
+        Every async request path goes through here: the shared semaphore
+        caps concurrency, the token bucket paces request starts over
+        time, and transient 429 throttling is retried with exponential
+        backoff (0.5 -> 1 -> 2 s plus jitter) instead of surfacing as a
+        failure. Other errors propagate immediately.
+
+        Args:
+            func: Synchronous SDK method to invoke
+            max_attempts: Total attempts before giving up on throttling
+            base_delay: Backoff base in seconds
+
+        Returns:
+            Whatever the SDK method returns
+        """
+        for attempt in range(max_attempts):
+            try:
+                async with self._request_semaphore:
+                    await self._rate_limiter.acquire()
+                    return await asyncio.to_thread(func, *args, **kwargs)
+            except Exception as e:
+                if attempt + 1 >= max_attempts or not _is_rate_limit_error(e):
+                    raise
+                await asyncio.sleep(base_delay * 2 ** attempt + random.uniform(0, 0.25))
+
+    async def get_project_languages(self) -> List[str]:
         """
         Get list of target languages for the project (cached).
-        
+
+        The first caller kicks off the fetch and stores the future;
+        concurrent callers await the same future, so only one metadata
+        round-trip ever happens per refresh. Cached values expire after
+        LANGUAGES_TTL so long-running servers pick up project changes.
+
         Returns:
             List of language codes
         """
-        if self._project_languages_cache is not None:
-            return self._project_languages_cache
-            
+        # Expire the cached result after the TTL (never expire an
+        # in-flight fetch - concurrent callers should keep sharing it)
+        if (
+            self._project_languages_future is not None
+            and self._project_languages_future.done()
+            and time.monotonic() - self._project_languages_ts >= self.LANGUAGES_TTL
+        ):
+            self._project_languages_future = None
+
+        if self._project_languages_future is None:
+            self._project_languages_ts = time.monotonic()
+            self._project_languages_future = asyncio.ensure_future(
+                self._fetch_project_languages()
+            )
+
+        try:
+            return await self._project_languages_future
+        except Exception:
+            # Don't poison the cache with a failed fetch
+            self._project_languages_future = None
+            raise
+
+    async def _fetch_project_languages(self) -> List[str]:
+        """
+        Fetch the target language list, preferring the on-disk cache.
+
+        A fresh disk entry skips the metadata round-trip entirely on
+        process start; TTL-driven refreshes later in the process go to
+        the API so the disk entry can't mask project changes, and a real
+        fetch rewrites the entry for next time.
+
+        Returns:
+            List of language codes
+        """
+        if not self._languages_fetched_once:
+            cached = self._load_languages_from_disk()
+            if cached is not None:
+                self._languages_fetched_once = True
+                return cached
+
         try:
-            project_info = self.client.projects.get_project(projectId=self.project_id)
+            project_info = await self._api_call(
+                self._projects.get_project, projectId=self.project_id
+            )
             target_languages = project_info['data'].get('targetLanguages', [])
-            self._project_languages_cache = [lang['id'] for lang in target_languages]
-            return self._project_languages_cache
+            languages = [lang['id'] for lang in target_languages]
+            self._languages_fetched_once = True
+            self._store_languages_to_disk(languages)
+            return languages
         except Exception as e:
-            raise Exception(f"Failed to get project languages: {str(e)}")
+            raise CrowdinApiError(f"Failed to get project languages: {str(e)}")
+
+    def _languages_cache_path(self) -> Path:
+        """Path of the on-disk language cache for this project."""
+        return self.DISK_CACHE_DIR / f"project_{self.project_id}_languages.json"
+
+    def _load_languages_from_disk(self) -> Optional[List[str]]:
+        """
+        Load the cached language list if it exists and is still fresh.
+
+        Returns:
+            Cached list of language codes, or None on miss/expiry/error
+        """
+        path = self._languages_cache_path()
+        try:
+            if time.time() - path.stat().st_mtime >= self.LANGUAGES_DISK_TTL:
+                return None
+            languages = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        if isinstance(languages, list) and all(isinstance(lang, str) for lang in languages):
+            return languages
+        return None
+
+    def _store_languages_to_disk(self, languages: List[str]) -> None:
+        """Persist the language list for future runs (best effort)."""
+        try:
+            self.DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            self._languages_cache_path().write_text(json.dumps(languages))
+        except OSError:
+            pass
     
-    def get_untranslated_strings(
-        self, 
+    async def get_untranslated_strings(
+        self,
         limit: int = 500,
-        exclude_labels: Optional[List[str]] = None
+        exclude_labels: Optional[Iterable[str]] = None
     ) -> List[UntranslatedString]:
         """
         Get strings that are not fully translated with detailed language-by-language status.
@@ -71,7 +316,7 @@ class CrowdinClient:
         
         Args:
             limit: Maximum number of strings to fetch (default: 500)
-            exclude_labels: List of label names to exclude (e.g., ["do-not-translate", "keep-original"])
+            exclude_labels: Label names to exclude (e.g., ["do-not-translate", "keep-original"])
             
         Returns:
             List of strings with incomplete translations, including:
@@ -81,73 +326,177 @@ class CrowdinClient:
             - translation_progress: detailed status per language
         """
         try:
-            # Get all target languages
-            target_languages = self.get_project_languages()
-            total_languages = len(target_languages)
-            
-            # Build CroQL query to find untranslated strings
-            croql = f'count of translations < {total_languages}'
-            
-            # Add label exclusion using count of labels
-            # Exclude strings that have any of the specified labels
-            if exclude_labels:
-                for label_name in exclude_labels:
-                    croql += f' and count of labels where (title = "{label_name}") = 0'
-            
-            # Fetch strings using CroQL
-            result = self.client.source_strings.list_strings(
-                projectId=self.project_id,
-                croql=croql,
-                limit=limit
+            return [
+                string
+                async for string in self.iter_untranslated_strings(limit, exclude_labels)
+            ]
+        except Exception as e:
+            raise CrowdinApiError(f"Failed to get untranslated strings: {str(e)}")
+
+    async def iter_untranslated_strings(
+        self,
+        limit: int = 500,
+        exclude_labels: Optional[Iterable[str]] = None
+    ) -> AsyncIterator[UntranslatedString]:
+        """
+        Stream strings that are not fully translated, page by page.
+
+        Unlike get_untranslated_strings this never materializes the full
+        result set: each page of strings is resolved (bulk translation
+        fetch) and yielded while the next page is already downloading, so
+        callers can start processing after the first page instead of
+        waiting for everything.
+
+        Args:
+            limit: Maximum number of strings to fetch (default: 500)
+            exclude_labels: Label names to exclude (e.g., ["do-not-translate", "keep-original"])
+
+        Yields:
+            UntranslatedString instances as their translations arrive
+        """
+        # Get all target languages
+        target_languages = await self.get_project_languages()
+        total_languages = len(target_languages)
+        # One shared tuple for every string instead of per-string lists/dicts
+        languages_tuple = tuple(target_languages)
+
+        # Build CroQL query to find untranslated strings, excluding
+        # strings that carry any of the given labels
+        croql = self.CROQL_UNTRANSLATED.format(total_languages=total_languages)
+        if exclude_labels:
+            croql += _croql_label_exclusion(tuple(sorted(exclude_labels)))
+
+        page_size = min(limit, 500)
+        yielded = 0
+
+        # Producer/consumer pipeline: the producer pages through the
+        # string list and immediately launches the bulk translation fetch
+        # for each page, so downloading page N+1 and resolving page N's
+        # translations run concurrently. (An asyncio.Queue of tasks is
+        # used instead of TaskGroup to keep 3.10 support.)
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def produce():
+            offset = 0
+            page_task = asyncio.ensure_future(
+                self._fetch_strings_page(croql, offset, page_size)
             )
-            
-            untranslated = []
-            
-            for item in result['data']:
-                string_data = item['data']
-                string_id = string_data.get('id')
-                
-                # Get labels for this string
-                labels = [label.get('name', '') for label in string_data.get('labels', [])]
-                
-                # Get existing translations and calculate missing languages
-                existing_translations = self._get_string_translations(string_id)
-                missing_languages = [
-                    lang for lang in target_languages 
-                    if lang not in existing_translations or not existing_translations[lang]
-                ]
-                
-                # Build translation progress dictionary
-                translation_progress = {}
-                for lang in target_languages:
-                    if lang in existing_translations and existing_translations[lang]:
-                        translation_progress[lang] = {
-                            'status': 'translated',
-                            'has_translation': True
-                        }
+            try:
+                while page_task is not None:
+                    page = (await page_task).get('data', [])
+                    offset += page_size
+
+                    # Prefetch the next page before resolving the current one
+                    if len(page) == page_size and offset < limit:
+                        next_size = min(page_size, limit - offset)
+                        page_task = asyncio.ensure_future(
+                            self._fetch_strings_page(croql, offset, next_size)
+                        )
                     else:
-                        translation_progress[lang] = {
-                            'status': 'missing',
-                            'has_translation': False
-                        }
-                
-                untranslated.append(UntranslatedString(
-                    id=string_id,
-                    text=string_data.get('text', ''),
-                    identifier=string_data.get('identifier', ''),
-                    context=string_data.get('context'),
-                    file_id=string_data.get('fileId'),
-                    labels=labels,
-                    existing_translations=existing_translations,
-                    missing_languages=missing_languages,
-                    translation_progress=translation_progress
-                ))
-            
-            return untranslated
-            
-        except Exception as e:
-            raise Exception(f"Failed to get untranslated strings: {str(e)}")
-    
+                        page_task = None
+
+                    # Kick off this page's bulk translation fetch without
+                    # waiting for it - the consumer awaits it in order
+                    string_ids = [item['data'].get('id') for item in page]
+                    translations_task = asyncio.ensure_future(
+                        self._get_translations_bulk(string_ids, target_languages)
+                    )
+                    await queue.put((page, translations_task))
+            except asyncio.CancelledError:
+                if page_task is not None:
+                    page_task.cancel()
+                raise
+            finally:
+                await queue.put(None)
+
+        producer = asyncio.ensure_future(produce())
+
+        try:
+            while True:
+                entry = await queue.get()
+                if entry is None:
+                    break
+
+                page, translations_task = entry
+                translations_by_string = await translations_task
+
+                for item in page:
+                    if yielded >= limit:
+                        return
+
+                    string_data = item['data']
+                    string_id = string_data.get('id')
+
+                    # Get labels for this string
+                    labels = [label.get('name', '') for label in string_data.get('labels', [])]
+
+                    # Pack per-language status into a bitmask (bit i set =
+                    # languages_tuple[i] has a translation)
+                    existing_translations = translations_by_string.get(string_id, {})
+                    translated_mask = 0
+                    for i, lang in enumerate(languages_tuple):
+                        if existing_translations.get(lang):
+                            translated_mask |= 1 << i
+
+                    yield UntranslatedString(
+                        id=string_id,
+                        text=string_data.get('text', ''),
+                        identifier=string_data.get('identifier', ''),
+                        context=string_data.get('context'),
+                        file_id=string_data.get('fileId'),
+                        labels=labels,
+                        existing_translations=existing_translations,
+                        target_languages=languages_tuple,
+                        translated_mask=translated_mask
+                    )
+                    yielded += 1
+
+            # Surface any producer failure to the caller
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+            # Retrieve the producer's outcome even when the iterator is
+            # abandoned early: cancelling a completed task is a no-op and
+            # its stored exception would otherwise be logged as "Task
+            # exception was never retrieved"
+            await asyncio.gather(producer, return_exceptions=True)
+            # Reap translation tasks the consumer never awaited,
+            # retrieving their results for the same reason
+            leftovers = []
+            while not queue.empty():
+                entry = queue.get_nowait()
+                if entry is not None:
+                    entry[1].cancel()
+                    leftovers.append(entry[1])
+            if leftovers:
+                await asyncio.gather(*leftovers, return_exceptions=True)
+
+    async def _fetch_strings_page(
+        self,
+        croql: str,
+        offset: int,
+        page_limit: int
+    ) -> Dict[str, Any]:
+        """
+        Fetch one page of source strings.
+
+        Args:
+            croql: CroQL filter for the string list
+            offset: Pagination offset
+            page_limit: Page size
+
+        Returns:
+            Raw API response for the page
+        """
+        return await self._api_call(
+            self._source_strings.list_strings,
+            projectId=self.project_id,
+            croql=croql,
+            offset=offset,
+            limit=page_limit
+        )
+
     def add_translation(
         self,
         string_id: int,
@@ -166,32 +515,36 @@ class CrowdinClient:
             API response data with translation details
         """
         try:
-            result = self.client.string_translations.add_translation(
+            result = self._string_translations.add_translation(
                 stringId=string_id,
                 languageId=language_code,
                 text=translation,
                 projectId=self.project_id
             )
+            # The cached per-string snapshot is stale now
+            self._string_translations_cache.pop(string_id, None)
             return result
         except Exception as e:
-            raise Exception(f"Failed to add translation for string {string_id} in {language_code}: {str(e)}")
+            raise CrowdinApiError(f"Failed to add translation for string {string_id} in {language_code}: {str(e)}")
     
-    def add_translations_batch(
+    async def add_translations_batch(
         self,
         translations: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """
         Add multiple translations in a single batch operation.
-        
-        This method uploads multiple translations and returns detailed results
-        for each translation attempt, including success/failure status.
-        
+
+        Uploads run concurrently (bounded by the request semaphore) instead
+        of one blocking round-trip per translation, and very large batches
+        are processed in chunks of 500. Results keep the original order and
+        include per-translation success/failure status.
+
         Args:
             translations: List of translation dictionaries, each containing:
                 - string_id: ID of the source string
                 - language_code: Target language code
                 - translation: Translated text
-        
+
         Returns:
             List of result dictionaries with:
                 - success: bool - whether translation was added successfully
@@ -201,31 +554,51 @@ class CrowdinClient:
                 - error: str - error message (if failed)
         """
         results = []
-        
-        for trans in translations:
-            try:
-                result = self.add_translation(
-                    trans["string_id"],
-                    trans["language_code"],
-                    trans["translation"]
-                )
-                results.append({
-                    "success": True,
-                    "string_id": trans["string_id"],
-                    "language_code": trans["language_code"],
-                    "data": result
-                })
-            except Exception as e:
-                results.append({
-                    "success": False,
-                    "string_id": trans["string_id"],
-                    "language_code": trans["language_code"],
-                    "error": str(e)
-                })
-        
+        chunk_size = 500
+
+        for start in range(0, len(translations), chunk_size):
+            chunk = translations[start:start + chunk_size]
+            tasks = [self._add_translation_bounded(trans) for trans in chunk]
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+            for trans, outcome in zip(chunk, outcomes):
+                if isinstance(outcome, Exception):
+                    results.append({
+                        "success": False,
+                        "string_id": trans["string_id"],
+                        "language_code": trans["language_code"],
+                        "error": str(outcome)
+                    })
+                else:
+                    results.append({
+                        "success": True,
+                        "string_id": trans["string_id"],
+                        "language_code": trans["language_code"],
+                        "data": outcome
+                    })
+
         return results
+
+    async def _add_translation_bounded(self, trans: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Upload a single translation through the shared request path.
+
+        Throttling retry and concurrency bounding live in _api_call.
+
+        Args:
+            trans: Translation dictionary with string_id, language_code, translation
+
+        Returns:
+            API response data with translation details
+        """
+        return await self._api_call(
+            self.add_translation,
+            trans["string_id"],
+            trans["language_code"],
+            trans["translation"]
+        )
     
-    def search_string(
+    async def search_string(
         self,
         source_text: str
     ) -> Optional[Dict[str, Any]]:
@@ -251,16 +624,15 @@ class CrowdinClient:
             }
         """
         try:
-            # Escape quotes for CroQL query
-            escaped_text = source_text.replace('"', '\\"')
-            croql = f'text = "{escaped_text}"'
-            
-            result = self.client.source_strings.list_strings(
+            croql = self.CROQL_TEXT_EQUALS.format(text=_escape_croql(source_text))
+
+            result = await self._api_call(
+                self._source_strings.list_strings,
                 projectId=self.project_id,
                 croql=croql,
                 limit=1
             )
-            
+
             if not result['data']:
                 return None
             
@@ -268,10 +640,10 @@ class CrowdinClient:
             string_id = string_data.get('id')
             
             # Get all translations for this string
-            translations = self._get_string_translations(string_id)
+            translations = await self._get_string_translations(string_id)
             
             # Get all target languages and determine missing ones
-            target_languages = self.get_project_languages()
+            target_languages = await self.get_project_languages()
             missing_languages = [
                 lang for lang in target_languages 
                 if lang not in translations or not translations[lang]
@@ -293,70 +665,193 @@ class CrowdinClient:
             }
             
         except Exception as e:
-            raise Exception(f"Failed to search string: {str(e)}")
+            raise CrowdinApiError(f"Failed to search string: {str(e)}")
     
-    def _get_string_translations(
+    async def _get_string_translations(
         self,
         string_id: int
     ) -> Dict[str, str]:
         """
         Get all translations for a specific string across all target languages.
-        
-        This method queries each target language individually to get the
-        most recent approved or pending translation.
-        
+
+        Results are memoized per string ID for the lifetime of the process
+        (invalidated when add_translation writes to the string), so repeated
+        lookups in classify -> translate -> re-check workflows skip the
+        network entirely. Per-language lookups for a cache miss are
+        dispatched concurrently, bounded by the request semaphore.
+
         Args:
             string_id: String ID
-            
+
         Returns:
             Dictionary mapping language codes to translation texts
             Only includes languages that have non-empty translations
         """
-        translations = {}
-        
+        cached = self._string_translations_cache.get(string_id)
+        if cached is not None:
+            return cached
+
         try:
             # Get all target languages
-            project_languages = self.get_project_languages()
-            
-            # Query translations for each language
-            for lang_code in project_languages:
-                try:
-                    # Get translations for this string in this language
-                    result = self.client.string_translations.list_string_translations(
-                        projectId=self.project_id,
-                        stringId=string_id,
-                        languageId=lang_code,
-                        limit=10
+            project_languages = await self.get_project_languages()
+
+            # Query all languages concurrently
+            tasks = [
+                self._fetch_language_translation(string_id, lang_code)
+                for lang_code in project_languages
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            translations = {}
+            complete = True
+            for lang_code, text in zip(project_languages, results):
+                if isinstance(text, BaseException):
+                    # Failed lookup - the result is usable but degraded
+                    complete = False
+                elif isinstance(text, str) and text.strip():
+                    translations[lang_code] = text
+
+            # Only memoize complete results: caching a dict assembled
+            # during a failure window would freeze "no translation" for
+            # the failed languages until restart
+            if complete:
+                # Evict the oldest entry once the cache is full
+                if len(self._string_translations_cache) >= self.STRING_TRANSLATIONS_CACHE_SIZE:
+                    self._string_translations_cache.pop(
+                        next(iter(self._string_translations_cache))
                     )
-                    
-                    # Get the most recent translation (usually approved or latest)
-                    if result.get('data') and len(result['data']) > 0:
-                        trans_data = result['data'][0].get('data', {})
-                        translation_text = trans_data.get('text', '')
-                        
-                        # Only add non-empty translations
-                        if translation_text and translation_text.strip():
-                            translations[lang_code] = translation_text
-                        
-                except Exception:
-                    # Language might not have translation, continue to next
-                    continue
-            
+                self._string_translations_cache[string_id] = translations
+
             return translations
-            
+
         except Exception:
             # Return empty dict if we can't get translations
             return {}
+
+    async def _fetch_language_translation(
+        self,
+        string_id: int,
+        lang_code: str
+    ) -> Optional[str]:
+        """
+        Fetch the most recent translation for one string in one language.
+
+        The official client is synchronous, so the call is offloaded to a
+        worker thread; the shared semaphore caps concurrent requests.
+
+        Args:
+            string_id: String ID
+            lang_code: Target language code
+
+        Returns:
+            Translation text, or None if no translation exists
+        """
+        result = await self._api_call(
+            self._string_translations.list_string_translations,
+            projectId=self.project_id,
+            stringId=string_id,
+            languageId=lang_code,
+            limit=10
+        )
+
+        # Get the most recent translation (usually approved or latest)
+        if result.get('data'):
+            return result['data'][0].get('data', {}).get('text', '')
+        return None
+
+    async def _get_translations_bulk(
+        self,
+        string_ids: List[int],
+        target_languages: List[str]
+    ) -> Dict[int, Dict[str, str]]:
+        """
+        Get translations for many strings at once, bucketed per string.
+
+        Uses Crowdin's bulk list_language_translations endpoint: one
+        paginated request per target language covers every string ID,
+        instead of one request per (string, language) pair.
+
+        Args:
+            string_ids: IDs of the source strings
+            target_languages: Language codes to fetch translations for
+
+        Returns:
+            Dictionary mapping string ID to {language code: translation text}
+        """
+        translations_by_string: Dict[int, Dict[str, str]] = {sid: {} for sid in string_ids}
+
+        if not string_ids:
+            return translations_by_string
+
+        tasks = [
+            self._fetch_language_translations_bulk(string_ids, lang_code)
+            for lang_code in target_languages
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for lang_code, items in zip(target_languages, results):
+            # Language might have no translations or the call failed
+            if isinstance(items, Exception):
+                continue
+            for trans_data in items:
+                string_id = trans_data.get('stringId')
+                text = trans_data.get('text', '')
+                if string_id in translations_by_string and text and text.strip():
+                    translations_by_string[string_id].setdefault(lang_code, text)
+
+        return translations_by_string
+
+    async def _fetch_language_translations_bulk(
+        self,
+        string_ids: List[int],
+        lang_code: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch all translations for the given strings in one language.
+
+        Args:
+            string_ids: IDs of the source strings
+            lang_code: Target language code
+
+        Returns:
+            List of raw translation data dictionaries from the API
+        """
+        items = []
+        offset = 0
+        page_size = 500
+
+        while True:
+            result = await self._api_call(
+                self._string_translations.list_language_translations,
+                projectId=self.project_id,
+                languageId=lang_code,
+                stringIds=string_ids,
+                offset=offset,
+                limit=page_size
+            )
+
+            page = result.get('data', [])
+            items.extend(item.get('data', {}) for item in page)
+
+            if len(page) < page_size:
+                return items
+            offset += page_size
     
     def list_labels(self) -> List[Dict[str, Any]]:
         """
-        Get list of all labels in the project.
-        
+        Get list of all labels in the project (cached with a short TTL).
+
         Returns:
             List of label dictionaries with 'id' and 'title'
         """
+        if (
+            self._labels_cache is not None
+            and time.monotonic() - self._labels_cache_ts < self.LABELS_CACHE_TTL
+        ):
+            return self._labels_cache
+
         try:
-            result = self.client.labels.list_labels(projectId=self.project_id)
+            result = self._labels.list_labels(projectId=self.project_id)
             labels = []
             for item in result.get('data', []):
                 label_data = item.get('data', {})
@@ -364,9 +859,11 @@ class CrowdinClient:
                     'id': label_data.get('id'),
                     'title': label_data.get('title')
                 })
+            self._labels_cache = labels
+            self._labels_cache_ts = time.monotonic()
             return labels
         except Exception as e:
-            raise Exception(f"Failed to list labels: {str(e)}")
+            raise CrowdinApiError(f"Failed to list labels: {str(e)}")
     
     def add_label(self, title: str) -> Dict[str, Any]:
         """
@@ -379,17 +876,19 @@ class CrowdinClient:
             Created label data with 'id' and 'title'
         """
         try:
-            result = self.client.labels.add_label(
+            result = self._labels.add_label(
                 title=title,
                 projectId=self.project_id
             )
             label_data = result.get('data', {})
+            # New label makes the cached list stale
+            self._labels_cache = None
             return {
                 'id': label_data.get('id'),
                 'title': label_data.get('title')
             }
         except Exception as e:
-            raise Exception(f"Failed to create label '{title}': {str(e)}")
+            raise CrowdinApiError(f"Failed to create label '{title}': {str(e)}")
     
     def assign_label_to_strings(
         self,
@@ -407,14 +906,14 @@ class CrowdinClient:
             API response data
         """
         try:
-            result = self.client.labels.assign_label_to_strings(
+            result = self._labels.assign_label_to_strings(
                 labelId=label_id,
                 stringIds=string_ids,
                 projectId=self.project_id
             )
             return result
         except Exception as e:
-            raise Exception(f"Failed to assign label to strings: {str(e)}")
+            raise CrowdinApiError(f"Failed to assign label to strings: {str(e)}")
     
     def unassign_label_from_strings(
         self,
@@ -432,14 +931,14 @@ class CrowdinClient:
             API response data
         """
         try:
-            result = self.client.labels.unassign_label_from_strings(
+            result = self._labels.unassign_label_from_strings(
                 labelId=label_id,
                 stringIds=string_ids,
                 projectId=self.project_id
             )
             return result
         except Exception as e:
-            raise Exception(f"Failed to unassign label from strings: {str(e)}")
+            raise CrowdinApiError(f"Failed to unassign label from strings: {str(e)}")
     
     def get_or_create_label(self, title: str) -> Dict[str, Any]:
         """
@@ -451,11 +950,25 @@ class CrowdinClient:
         Returns:
             Label data with 'id' and 'title'
         """
-        # Check if label already exists
-        existing_labels = self.list_labels()
-        for label in existing_labels:
-            if label['title'] == title:
-                return label
-        
-        # Create new label if it doesn't exist
-        return self.add_label(title)
+        # Check the cached label list first (no round-trip when fresh);
+        # honor the same TTL as list_labels so a stale snapshot can't
+        # hand out IDs for labels deleted since the last fetch
+        if (
+            self._labels_cache is not None
+            and time.monotonic() - self._labels_cache_ts < self.LABELS_CACHE_TTL
+        ):
+            for label in self._labels_cache:
+                if label['title'] == title:
+                    return label
+
+        # Optimistically create the label - one round-trip in the common
+        # case instead of a list-then-create pair
+        try:
+            return self.add_label(title)
+        except Exception:
+            # Label probably already exists; re-fetch and look it up
+            self._labels_cache = None
+            for label in self.list_labels():
+                if label['title'] == title:
+                    return label
+            raise
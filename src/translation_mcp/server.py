@@ -5,14 +5,41 @@ It helps AI assistants and developers efficiently handle translation workflows.
 """
 
 import asyncio
+import io
 import json
+import os
+import sys
+from collections import defaultdict
+from itertools import islice
 from typing import Any, Dict, List
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 from mcp import stdio_server
 
 from .config import TranslationConfig
-from .crowdin_client import CrowdinClient
+from .crowdin_client import CrowdinApiError, CrowdinClient, UntranslatedString
+from .string_classifier import StringClassifier, StringType
+
+# Machine consumers don't need indentation; set MCP_PRETTY=1 to get
+# human-readable JSON when debugging by hand ("0"/"false" stay compact)
+_PRETTY = os.environ.get("MCP_PRETTY", "").lower() not in ("", "0", "false")
+
+try:
+    import orjson
+
+    _ORJSON_OPTS = orjson.OPT_INDENT_2 if _PRETTY else 0
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize a response payload with orjson (C-level, ~5x stdlib)."""
+        return orjson.dumps(obj, option=_ORJSON_OPTS).decode()
+
+except ImportError:  # orjson is an optional speedup, stdlib works fine
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize a response payload with the stdlib json module."""
+        if _PRETTY:
+            return json.dumps(obj, indent=2, ensure_ascii=False)
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
 
 
 # Initialize server
@@ -36,10 +63,10 @@ def initialize_clients():
     )
 
 
-@app.list_tools()
-async def list_tools() -> List[Tool]:
-    """List available MCP tools with detailed descriptions for AI understanding."""
-    return [
+# Tool schema never changes at runtime - build it once at import instead
+# of reallocating the Tool objects and their description strings per
+# tools/list request
+_TOOLS: List[Tool] = [
         Tool(
             name="get_project_info",
             description="""Get Crowdin project information and configuration.
@@ -76,10 +103,14 @@ async def list_tools() -> List[Tool]:
             You MUST return ONLY a markdown table. No summaries, no tips, no extra text.
             
             CORRECT FORMAT:
-            | ID | Text | Identifier | Missing Languages |
-            |----|------|------------|-------------------|
-            | 36 | `Routine` | `routine` | fr, de, it |
-            | 38 | `{numMinutes} min` | `numMinutes` | fr, es-ES, it |
+            | ID | Text | Identifier | Missing Languages | Note |
+            |----|------|------------|-------------------|------|
+            | 36 | `Routine` | `routine` | fr, de, it | |
+            | 38 | `{numMinutes} min` | `numMinutes` | fr, es-ES, it | |
+
+            The Note column flags strings that may not need literal
+            translation (proper names, brands, language names, technical
+            terms) - review those before translating.
             
             MANDATORY RULES:
             ✅ ALWAYS display the complete table with ALL rows
@@ -279,411 +310,455 @@ async def list_tools() -> List[Tool]:
                 "required": ["source_text"]
             }
         )
-    ]
+]
+
+
+@app.list_tools()
+async def list_tools() -> List[Tool]:
+    """List available MCP tools with detailed descriptions for AI understanding."""
+    return _TOOLS
 
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
-    """Handle tool calls with proper routing."""
-    
-    # Ensure clients are initialized
-    if crowdin_client is None:
-        initialize_clients()
-    
-    if name == "get_project_info":
-        return await handle_get_project_info()
-    
-    elif name == "get_untranslated_strings":
-        return await handle_get_untranslated(arguments)
-    
-    elif name == "manage_labels":
-        return await handle_manage_labels(arguments)
-    
-    elif name == "upload_translations":
-        return await handle_upload_translations(arguments)
-    
-    elif name == "search_string":
-        return await handle_search_string(arguments)
-    
-    else:
-        raise ValueError(f"Unknown tool: {name}")
-
+    """Handle tool calls with proper routing.
 
-async def handle_get_project_info() -> List[TextContent]:
-    """Get project information including target languages."""
+    Clients are initialized by run_server() before the first call, so the
+    dispatch path stays free of init checks.
+    """
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
     try:
-        languages = crowdin_client.get_project_languages()
-        
-        info = {
-            "project_id": config.crowdin_project_id,
-            "target_languages": languages,
-            "total_languages": len(languages),
-            "message": "✅ Project loaded successfully"
-        }
-        
-        return [TextContent(
-            type="text",
-            text=json.dumps(info, indent=2, ensure_ascii=False)
-        )]
-        
-    except Exception as e:
+        return await handler(arguments)
+    except (CrowdinApiError, ValueError, KeyError) as e:
+        # Single error boundary for all tools: handlers stay straight-line
+        # and real tracebacks survive until this point for profiling.
+        # Anything else is a genuine bug and propagates to the framework
+        # with its traceback intact.
         return [TextContent(
             type="text",
-            text=f"❌ Error getting project info: {str(e)}"
+            text=f"❌ Error {_ERROR_CONTEXT[name]}: {str(e)}"
         )]
 
 
+async def handle_get_project_info(arguments: Dict[str, Any]) -> List[TextContent]:
+    """Get project information including target languages."""
+    languages = await crowdin_client.get_project_languages()
+    
+    info = {
+        "project_id": config.crowdin_project_id,
+        "target_languages": languages,
+        "total_languages": len(languages),
+        "message": "✅ Project loaded successfully"
+    }
+    
+    return [TextContent(
+        type="text",
+        text=_json_dumps(info)
+    )]
+
+
 async def handle_get_untranslated(arguments: Dict[str, Any]) -> List[TextContent]:
     """Get untranslated strings with beautiful table format - ALWAYS returns a table."""
-    try:
-        # Get parameters with default to exclude 'do-not-translate' label
-        limit = arguments.get("limit", 50)
-        exclude_labels = arguments.get("exclude_labels", ["do-not-translate"])
-        
-        # Get target languages
-        target_languages = crowdin_client.get_project_languages()
-        
-        # Get untranslated strings
-        untranslated = crowdin_client.get_untranslated_strings(
-            limit=limit,
-            exclude_labels=exclude_labels
-        )
-        
-        # Prepare string data
-        strings_data = []
-        for s in untranslated:
-            strings_data.append({
-                "id": s.id,
-                "text": s.text[:80] + "..." if len(s.text) > 80 else s.text,
-                "identifier": s.identifier,
-                "context": s.context,
-                "labels": s.labels,
-                "existing_translations": s.existing_translations,
-                "missing_languages": s.missing_languages,
-                "translation_progress": s.translation_progress
-            })
-        
-        # Build response - ALWAYS returns table, even if empty
-        response = _build_translation_table(strings_data)
-        
-        return [TextContent(
-            type="text",
-            text=response
-        )]
-        
-    except Exception as e:
-        return [TextContent(
-            type="text",
-            text=f"❌ Error getting untranslated strings: {str(e)}"
-        )]
+    # Get parameters with default to exclude 'do-not-translate' label
+    limit = arguments.get("limit", 50)
+    # Hashed membership for downstream filtering; an explicit empty list
+    # still means "exclude nothing"
+    exclude_labels = frozenset(arguments.get("exclude_labels", ("do-not-translate",)))
+
+    # Get untranslated strings; the client resolves the (cached) target
+    # language list itself, so no separate await is needed here
+    untranslated = await crowdin_client.get_untranslated_strings(
+        limit=limit,
+        exclude_labels=exclude_labels
+    )
+
+    # ALWAYS returns a table, even if empty - the empty case reuses a
+    # prebuilt content object
+    if not untranslated:
+        return [_EMPTY_TABLE_CONTENT]
+
+    # Build response straight from the client objects. Large batches are
+    # rendered in a worker thread so classification and row formatting
+    # don't stall the event loop for concurrent tool calls
+    if len(untranslated) > _TABLE_OFFLOAD_ROWS:
+        response = await asyncio.to_thread(_build_translation_table, untranslated)
+    else:
+        response = _build_translation_table(untranslated)
+
+    return [TextContent(
+        type="text",
+        text=response
+    )]
+
+
+# Pre-parsed row template - one C-level substitution per row instead of
+# f-string BUILD_STRING/FORMAT_VALUE bytecode in the hot loop
+_ROW_FMT = "\n| %s | `%s` | `%s` | %s | %s |".__mod__
+
+_TABLE_HEADER = (
+    "| ID | Text | Identifier | Missing Languages | Note |\n"
+    "|----|------|------------|-------------------|------|"
+)
+
+_EMPTY_TABLE = _TABLE_HEADER + "\n| - | *All strings translated* | - | - | - |"
+
+# Fully-translated projects hit this on every poll; reuse one validated
+# content object instead of re-running pydantic construction each time
+_EMPTY_TABLE_CONTENT = TextContent(type="text", text=_EMPTY_TABLE)
+
+
+def _err(message: str) -> List[TextContent]:
+    """Build a ready-to-return error response list."""
+    return [TextContent(type="text", text=f"❌ Error: {message}")]
 
 
-def _build_translation_table(strings_data: List[Dict]) -> str:
+# Fixed-wording validation errors, created once at import instead of
+# allocating a fresh TextContent on every bad call
+_ERR_NO_TRANSLATIONS = _err("No translations provided")
+_ERR_NO_SOURCE_TEXT = _err("No source text provided")
+_ERR_ASSIGN_NEEDS_LABEL = _err("label_name is required for 'assign' action")
+_ERR_ASSIGN_NEEDS_IDS = _err("string_ids is required for 'assign' action")
+_ERR_UNASSIGN_NEEDS_LABEL = _err("label_name is required for 'unassign' action")
+_ERR_UNASSIGN_NEEDS_IDS = _err("string_ids is required for 'unassign' action")
+
+# Stateless heuristics, safe to share across requests
+_classifier = StringClassifier()
+
+# Above this row count, table rendering moves to a worker thread so it
+# can't block the event loop; below it the thread hop costs more than
+# the formatting itself
+_TABLE_OFFLOAD_ROWS = 200
+
+# Per-type translation hints, built once at import instead of per row
+_NOTES: Dict[StringType, str] = {
+    StringType.REGULAR: "",
+    StringType.PROPER_NAME: "⚠️ Proper name - verify before translating",
+    StringType.BRAND: "⚠️ Brand - usually keep as-is",
+    StringType.TECHNICAL: "⚠️ Technical term - translate with care",
+    StringType.LANGUAGE_NAME: "⚠️ Language name - usually keep as-is",
+}
+
+
+def _trunc(s: str, n: int) -> str:
+    """Truncate s to n characters, ellipsis included, with a single branch."""
+    return f"{s[:n - 3]}..." if len(s) > n else s
+
+
+def _build_translation_table(strings: List[UntranslatedString]) -> str:
     """Build a markdown table showing translation status - ONLY table, no extras."""
-    
-    lines = []
-    
+
     # If no strings, show empty table with info message
-    if not strings_data:
-        lines.append("| ID | Text | Identifier | Missing Languages |")
-        lines.append("|----|------|------------|-------------------|")
-        lines.append("| - | *All strings translated* | - | - |")
-        return "\n".join(lines)
-    
-    # Table header
-    lines.append("| ID | Text | Identifier | Missing Languages |")
-    lines.append("|----|------|------------|-------------------|")
-    
-    # Table rows - ALL strings with ALL missing languages shown
-    for string in strings_data:
-        text = string['text']
-        # Truncate text if too long for readability in table
-        if len(text) > 50:
-            text = text[:47] + "..."
-        
-        identifier = string['identifier']
-        # Truncate identifier if too long
-        if len(identifier) > 30:
-            identifier = identifier[:27] + "..."
-        
-        # Show ALL missing languages without truncation or "and more..."
-        missing = ', '.join(string['missing_languages'])
-        
-        lines.append(f"| {string['id']} | `{text}` | `{identifier}` | {missing} |")
-    
+    if not strings:
+        return _EMPTY_TABLE
+
+    # One classifier call for the whole batch instead of per-row dispatch
+    types = _classifier.classify_many([(s.text, s.identifier) for s in strings])
+
+    # Bind hot names to locals once; the comprehension then runs without
+    # global lookups or .append dispatch per row
+    row = _ROW_FMT
+    trunc = _trunc
+    notes = _NOTES
+    join = ', '.join
+
+    # Table rows - ALL strings with ALL missing languages shown (no
+    # truncation or "and more..."), straight from the client objects.
+    # Text/identifier cells are capped at 50/30 chars for readability.
+    rows = [
+        row((s.id, trunc(s.text, 50), trunc(s.identifier, 30),
+             join(s.missing_languages), notes[t]))
+        for s, t in zip(strings, types)
+    ]
+
     # Return ONLY the table - no headers, no instructions, no tips
-    return "\n".join(lines)
+    return _TABLE_HEADER + ''.join(rows)
 
 
 async def handle_upload_translations(arguments: Dict[str, Any]) -> List[TextContent]:
     """Upload translations to Crowdin with detailed results."""
-    try:
-        translations = arguments.get("translations", [])
-        
-        if not translations:
-            return [TextContent(
-                type="text",
-                text="❌ Error: No translations provided"
-            )]
-        
-        # Upload translations in batch
-        results = crowdin_client.add_translations_batch(translations)
-        
-        # Count successes and failures
-        success_count = sum(1 for r in results if r.get("success"))
-        failure_count = len(results) - success_count
-        
-        # Build response
-        response_lines = []
-        response_lines.append("# 📤 Translation Upload Results")
-        response_lines.append("")
-        response_lines.append(f"**Total translations:** {len(results)}")
-        response_lines.append(f"**✅ Successful:** {success_count}")
-        response_lines.append(f"**❌ Failed:** {failure_count}")
-        response_lines.append("")
-        
-        if failure_count > 0:
-            response_lines.append("## Failed Translations")
-            response_lines.append("")
-            failed_items = [r for r in results if not r.get("success")]
-            for item in failed_items[:10]:  # Show first 10 failures
-                response_lines.append(f"- **String ID {item['string_id']}** ({item['language_code']}): {item['error']}")
-            if len(failed_items) > 10:
-                response_lines.append(f"- ... and {len(failed_items) - 10} more failures")
-            response_lines.append("")
-        
-        if success_count > 0:
-            response_lines.append("## ✅ Successfully Uploaded")
-            response_lines.append("")
-            success_items = [r for r in results if r.get("success")]
-            # Group by string_id
-            by_string = {}
-            for item in success_items:
-                sid = item['string_id']
-                if sid not in by_string:
-                    by_string[sid] = []
-                by_string[sid].append(item['language_code'])
-            
-            for string_id, langs in by_string.items():
-                response_lines.append(f"- **String ID {string_id}:** {', '.join(langs)}")
-            response_lines.append("")
-        
-        response_lines.append(f"**Status:** {'✅ All translations uploaded successfully!' if failure_count == 0 else '⚠️ Some translations failed'}")
-        
+    translations = arguments.get("translations", [])
+    
+    if not translations:
+        return _ERR_NO_TRANSLATIONS
+    
+    # Split well-formed items from malformed ones locally in one pass -
+    # a bad item should not cost a network round-trip just to fail
+    valid = []
+    failed_items = []
+    for t in translations:
+        if (
+            isinstance(t, dict)
+            and isinstance(t.get("string_id"), int)
+            and t.get("language_code")
+            and t.get("translation")
+        ):
+            valid.append(t)
+        else:
+            failed_items.append({
+                "success": False,
+                "string_id": t.get("string_id") if isinstance(t, dict) else None,
+                "language_code": t.get("language_code") if isinstance(t, dict) else None,
+                "error": "invalid item: string_id (int), language_code and translation are required"
+            })
+
+    # Upload the valid translations in batch
+    results = await crowdin_client.add_translations_batch(valid) if valid else []
+
+    # Single pass over results: group successes by string and collect failures
+    by_string: Dict[int, List[str]] = defaultdict(list)
+    for item in results:
+        if item.get("success"):
+            by_string[item["string_id"]].append(item["language_code"])
+        else:
+            failed_items.append(item)
+    failure_count = len(failed_items)
+    success_count = len(translations) - failure_count
+
+    # Build response
+    buf = io.StringIO()
+    buf.write(
+        f"# 📤 Translation Upload Results\n"
+        f"\n"
+        f"**Total translations:** {len(translations)}\n"
+        f"**✅ Successful:** {success_count}\n"
+        f"**❌ Failed:** {failure_count}\n"
+        f"\n"
+    )
+
+    if failure_count > 0:
+        buf.write("## Failed Translations\n\n")
+        for item in islice(failed_items, 10):  # Show first 10 failures
+            buf.write(f"- **String ID {item['string_id']}** ({item['language_code']}): {item['error']}\n")
+        if failure_count > 10:
+            buf.write(f"- ... and {failure_count - 10} more failures\n")
+        buf.write("\n")
+
+    if success_count > 0:
+        buf.write("## ✅ Successfully Uploaded\n\n")
+        for string_id, langs in by_string.items():
+            buf.write(f"- **String ID {string_id}:** {', '.join(langs)}\n")
+        buf.write("\n")
+
+    buf.write(f"**Status:** {'✅ All translations uploaded successfully!' if failure_count == 0 else '⚠️ Some translations failed'}")
+
+    return [TextContent(
+        type="text",
+        text=buf.getvalue()
+    )]
+
+
+async def handle_search_string(arguments: Dict[str, Any]) -> List[TextContent]:
+    """Search for a string and display its translation status."""
+    source_text = arguments.get("source_text", "")
+    
+    if not source_text:
+        return _ERR_NO_SOURCE_TEXT
+    
+    # Search for the string and fetch the language list concurrently
+    # (the language fetch is cached after the first call anyway)
+    result, all_languages = await asyncio.gather(
+        crowdin_client.search_string(source_text),
+        crowdin_client.get_project_languages()
+    )
+
+    if not result:
         return [TextContent(
             type="text",
-            text="\n".join(response_lines)
+            text=f"❌ String not found: '{source_text}'"
         )]
-        
-    except Exception as e:
+    
+    # Build beautiful response
+    buf = io.StringIO()
+    buf.write(
+        f"# 🔍 String Search Results\n"
+        f"\n"
+        f"**String ID:** {result['id']}\n"
+        f"**Identifier:** `{result['identifier']}`\n"
+        f"**Source Text:** `{result['text']}`\n"
+    )
+
+    if result.get('context'):
+        buf.write(f"**Context:** {result['context']}\n")
+
+    if result.get('labels'):
+        buf.write(f"**Labels:** {', '.join(result['labels'])}\n")
+
+    # Translation status table
+    buf.write(
+        f"\n"
+        f"**Translation Progress:** {result['translation_count']}/{result['total_languages']} languages\n"
+        f"\n"
+        f"## Translation Status\n"
+        f"\n"
+        f"| Language | Status | Translation |\n"
+        f"|----------|--------|-------------|\n"
+    )
+
+    translations = result['translations']
+    for lang in all_languages:
+        translation = translations.get(lang)
+        if translation is not None:
+            buf.write(f"| {lang} | ✅ Translated | {_trunc(translation, 60)} |\n")
+        else:
+            buf.write(f"| {lang} | ❌ Missing | - |\n")
+
+    buf.write("\n")
+
+    missing = set(all_languages) - translations.keys()
+    if missing:
+        # Preserve the project's language order in the summary line
+        buf.write(f"**Missing languages:** {', '.join(lang for lang in all_languages if lang in missing)}")
+    else:
+        buf.write("**✅ Fully translated in all languages!**")
+
+    return [TextContent(
+        type="text",
+        text=buf.getvalue()
+    )]
+
+
+async def handle_manage_labels(arguments: Dict[str, Any]) -> List[TextContent]:
+    """Manage labels for strings in Crowdin."""
+    action = arguments.get("action", "")
+    
+    if action == "list":
+        # List all labels
+        labels = await asyncio.to_thread(crowdin_client.list_labels)
+
+        if not labels:
+            text = (
+                "# 🏷️ Project Labels\n"
+                "\n"
+                "**No labels found in project.**\n"
+                "\n"
+                "You can create labels by assigning them to strings:\n"
+                "```\n"
+                'manage_labels(action="assign", label_name="do-not-translate", string_ids=[123])\n'
+                "```"
+            )
+        else:
+            buf = io.StringIO()
+            buf.write(
+                "# 🏷️ Project Labels\n"
+                "\n"
+                "| ID | Label Name |\n"
+                "|----|------------|\n"
+            )
+            for label in labels:
+                buf.write(f"| {label['id']} | {label['title']} |\n")
+            buf.write(f"\n**Total labels:** {len(labels)}")
+            text = buf.getvalue()
+
         return [TextContent(
             type="text",
-            text=f"❌ Error uploading translations: {str(e)}"
+            text=text
         )]
-
-
-async def handle_search_string(arguments: Dict[str, Any]) -> List[TextContent]:
-    """Search for a string and display its translation status."""
-    try:
-        source_text = arguments.get("source_text", "")
-        
-        if not source_text:
-            return [TextContent(
-                type="text",
-                text="❌ Error: No source text provided"
-            )]
-        
-        # Search for the string
-        result = crowdin_client.search_string(source_text)
-        
-        if not result:
-            return [TextContent(
-                type="text",
-                text=f"❌ String not found: '{source_text}'"
-            )]
-        
-        # Build beautiful response
-        response_lines = []
-        response_lines.append("# 🔍 String Search Results")
-        response_lines.append("")
-        response_lines.append(f"**String ID:** {result['id']}")
-        response_lines.append(f"**Identifier:** `{result['identifier']}`")
-        response_lines.append(f"**Source Text:** `{result['text']}`")
-        
-        if result.get('context'):
-            response_lines.append(f"**Context:** {result['context']}")
-        
-        if result.get('labels'):
-            response_lines.append(f"**Labels:** {', '.join(result['labels'])}")
-        
-        response_lines.append("")
-        response_lines.append(f"**Translation Progress:** {result['translation_count']}/{result['total_languages']} languages")
-        response_lines.append("")
+    
+    elif action == "assign":
+        # Assign label to strings
+        label_name = arguments.get("label_name", "")
+        string_ids = arguments.get("string_ids", [])
         
-        # Translation status table
-        response_lines.append("## Translation Status")
-        response_lines.append("")
-        response_lines.append("| Language | Status | Translation |")
-        response_lines.append("|----------|--------|-------------|")
+        if not label_name:
+            return _ERR_ASSIGN_NEEDS_LABEL
         
-        all_languages = crowdin_client.get_project_languages()
-        for lang in all_languages:
-            if lang in result['translations']:
-                translation = result['translations'][lang]
-                if len(translation) > 60:
-                    translation = translation[:57] + "..."
-                response_lines.append(f"| {lang} | ✅ Translated | {translation} |")
-            else:
-                response_lines.append(f"| {lang} | ❌ Missing | - |")
+        if not string_ids:
+            return _ERR_ASSIGN_NEEDS_IDS
         
-        response_lines.append("")
+        # Get or create the label
+        label = await asyncio.to_thread(crowdin_client.get_or_create_label, label_name)
         
-        if result['missing_languages']:
-            response_lines.append(f"**Missing languages:** {', '.join(result['missing_languages'])}")
-        else:
-            response_lines.append("**✅ Fully translated in all languages!**")
+        # Assign label to strings
+        await asyncio.to_thread(crowdin_client.assign_label_to_strings, label['id'], string_ids)
         
+        text = (
+            f"# ✅ Label Assigned Successfully\n"
+            f"\n"
+            f"**Label:** `{label_name}` (ID: {label['id']})\n"
+            f"**Strings:** {len(string_ids)} strings marked\n"
+            f"**String IDs:** {', '.join(map(str, string_ids[:10]))}\n"
+        )
+        if len(string_ids) > 10:
+            text += f"... and {len(string_ids) - 10} more\n"
+        text += (
+            "\n"
+            "**Next steps:**\n"
+            "- These strings will now be filtered out by default in `get_untranslated_strings`\n"
+            "- Run `get_untranslated_strings` again to see the updated list"
+        )
+
         return [TextContent(
             type="text",
-            text="\n".join(response_lines)
+            text=text
         )]
+    
+    elif action == "unassign":
+        # Remove label from strings
+        label_name = arguments.get("label_name", "")
+        string_ids = arguments.get("string_ids", [])
         
-    except Exception as e:
-        return [TextContent(
-            type="text",
-            text=f"❌ Error searching string: {str(e)}"
-        )]
-
-
-async def handle_manage_labels(arguments: Dict[str, Any]) -> List[TextContent]:
-    """Manage labels for strings in Crowdin."""
-    try:
-        action = arguments.get("action", "")
+        if not label_name:
+            return _ERR_UNASSIGN_NEEDS_LABEL
         
-        if action == "list":
-            # List all labels
-            labels = crowdin_client.list_labels()
-            
-            response_lines = []
-            response_lines.append("# 🏷️ Project Labels")
-            response_lines.append("")
-            
-            if not labels:
-                response_lines.append("**No labels found in project.**")
-                response_lines.append("")
-                response_lines.append("You can create labels by assigning them to strings:")
-                response_lines.append('```')
-                response_lines.append('manage_labels(action="assign", label_name="do-not-translate", string_ids=[123])')
-                response_lines.append('```')
-            else:
-                response_lines.append("| ID | Label Name |")
-                response_lines.append("|----|------------|")
-                for label in labels:
-                    response_lines.append(f"| {label['id']} | {label['title']} |")
-                response_lines.append("")
-                response_lines.append(f"**Total labels:** {len(labels)}")
-            
-            return [TextContent(
-                type="text",
-                text="\n".join(response_lines)
-            )]
+        if not string_ids:
+            return _ERR_UNASSIGN_NEEDS_IDS
         
-        elif action == "assign":
-            # Assign label to strings
-            label_name = arguments.get("label_name", "")
-            string_ids = arguments.get("string_ids", [])
-            
-            if not label_name:
-                return [TextContent(
-                    type="text",
-                    text="❌ Error: label_name is required for 'assign' action"
-                )]
-            
-            if not string_ids:
-                return [TextContent(
-                    type="text",
-                    text="❌ Error: string_ids is required for 'assign' action"
-                )]
-            
-            # Get or create the label
-            label = crowdin_client.get_or_create_label(label_name)
-            
-            # Assign label to strings
-            crowdin_client.assign_label_to_strings(label['id'], string_ids)
-            
-            response_lines = []
-            response_lines.append("# ✅ Label Assigned Successfully")
-            response_lines.append("")
-            response_lines.append(f"**Label:** `{label_name}` (ID: {label['id']})")
-            response_lines.append(f"**Strings:** {len(string_ids)} strings marked")
-            response_lines.append(f"**String IDs:** {', '.join(map(str, string_ids[:10]))}")
-            if len(string_ids) > 10:
-                response_lines.append(f"... and {len(string_ids) - 10} more")
-            response_lines.append("")
-            response_lines.append("**Next steps:**")
-            response_lines.append("- These strings will now be filtered out by default in `get_untranslated_strings`")
-            response_lines.append("- Run `get_untranslated_strings` again to see the updated list")
-            
-            return [TextContent(
-                type="text",
-                text="\n".join(response_lines)
-            )]
+        # Find the label
+        labels = await asyncio.to_thread(crowdin_client.list_labels)
+        label = next((lbl for lbl in labels if lbl['title'] == label_name), None)
         
-        elif action == "unassign":
-            # Remove label from strings
-            label_name = arguments.get("label_name", "")
-            string_ids = arguments.get("string_ids", [])
-            
-            if not label_name:
-                return [TextContent(
-                    type="text",
-                    text="❌ Error: label_name is required for 'unassign' action"
-                )]
-            
-            if not string_ids:
-                return [TextContent(
-                    type="text",
-                    text="❌ Error: string_ids is required for 'unassign' action"
-                )]
-            
-            # Find the label
-            labels = crowdin_client.list_labels()
-            label = next((l for l in labels if l['title'] == label_name), None)
-            
-            if not label:
-                return [TextContent(
-                    type="text",
-                    text=f"❌ Error: Label '{label_name}' not found"
-                )]
-            
-            # Remove label from strings
-            crowdin_client.unassign_label_from_strings(label['id'], string_ids)
-            
-            response_lines = []
-            response_lines.append("# ✅ Label Removed Successfully")
-            response_lines.append("")
-            response_lines.append(f"**Label:** `{label_name}` (ID: {label['id']})")
-            response_lines.append(f"**Strings:** Label removed from {len(string_ids)} strings")
-            response_lines.append(f"**String IDs:** {', '.join(map(str, string_ids[:10]))}")
-            if len(string_ids) > 10:
-                response_lines.append(f"... and {len(string_ids) - 10} more")
-            
+        if not label:
             return [TextContent(
                 type="text",
-                text="\n".join(response_lines)
+                text=f"❌ Error: Label '{label_name}' not found"
             )]
         
-        else:
-            return [TextContent(
-                type="text",
-                text=f"❌ Error: Unknown action '{action}'. Use 'list', 'assign', or 'unassign'"
-            )]
+        # Remove label from strings
+        await asyncio.to_thread(crowdin_client.unassign_label_from_strings, label['id'], string_ids)
         
-    except Exception as e:
+        text = (
+            f"# ✅ Label Removed Successfully\n"
+            f"\n"
+            f"**Label:** `{label_name}` (ID: {label['id']})\n"
+            f"**Strings:** Label removed from {len(string_ids)} strings\n"
+            f"**String IDs:** {', '.join(map(str, string_ids[:10]))}"
+        )
+        if len(string_ids) > 10:
+            text += f"\n... and {len(string_ids) - 10} more"
+
         return [TextContent(
             type="text",
-            text=f"❌ Error managing labels: {str(e)}"
+            text=text
         )]
+    
+    else:
+        return [TextContent(
+            type="text",
+            text=f"❌ Error: Unknown action '{action}'. Use 'list', 'assign', or 'unassign'"
+        )]
+
+
+# O(1) dispatch table for call_tool; every handler takes the raw
+# arguments dict (get_project_info just ignores it)
+_HANDLERS = {
+    "get_project_info": handle_get_project_info,
+    "get_untranslated_strings": handle_get_untranslated,
+    "manage_labels": handle_manage_labels,
+    "upload_translations": handle_upload_translations,
+    "search_string": handle_search_string,
+}
+
+# Per-tool context for the call_tool error boundary, preserving the
+# error wording the handlers used before it was centralized
+_ERROR_CONTEXT = {
+    "get_project_info": "getting project info",
+    "get_untranslated_strings": "getting untranslated strings",
+    "manage_labels": "managing labels",
+    "upload_translations": "uploading translations",
+    "search_string": "searching string",
+}
 
 
 async def run_server():
@@ -702,6 +777,13 @@ async def run_server():
 
 def main():
     """Entry point for the MCP server (sync wrapper)."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:  # optional speedup, stock asyncio works fine
+            pass
+        else:
+            uvloop.install()
     asyncio.run(run_server())
 
 